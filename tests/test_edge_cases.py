@@ -1,6 +1,7 @@
 """Edge case tests for text extractor."""
 
 import pytest
+from pathlib import Path
 from unittest.mock import patch
 
 from textxtract import SyncTextExtractor
@@ -11,6 +12,9 @@ from textxtract.core.exceptions import (
     FileTypeNotSupportedError,
 )
 from textxtract.core.config import ExtractorConfig
+from textxtract.handlers.docx import DOCXHandler
+
+TEST_FILES_DIR = Path(__file__).parent / "files"
 
 
 class TestEdgeCases:
@@ -75,6 +79,200 @@ class TestEdgeCases:
         with pytest.raises((ExtractionError, InvalidFileError)):
             extractor.extract(corrupted_pdf, "corrupted.pdf")
 
+    @pytest.mark.parametrize("collector", ["_collect_with_lxml", "_collect_with_python_docx"])
+    def test_docx_complex_document(self, collector):
+        """Test both DOCX collectors on tabs, breaks, merged/nested tables,
+        text boxes, non-breaking hyphens and multi-section headers/footers."""
+        handler = DOCXHandler()
+        file_path = TEST_FILES_DIR / "text_file_complex.docx"
+
+        assert getattr(handler, collector)(file_path) == [
+            "Jane Doe",
+            # w:noBreakHyphen gives "-", a page break gives ""
+            "A well-known engineerand writer",
+            "See box",
+            "Second section body",
+            # Horizontally merged cell appears once
+            "Skills | Level",
+            # w:tab and a line break inside cells become spaces
+            "Name: Jane | Line1 Line2 | Expert",
+            "Last cell",
+            # Nested table rows follow the row that contains them
+            "Inner A | Inner B",
+            # Default header/footer per section; the first-page header is skipped
+            "Header text",
+            "Footer text",
+            "Second header",
+            "[TextBox: Boxed note]",
+        ]
+
+    @pytest.mark.parametrize("referenced", [True, False])
+    def test_docx_footnotes_only_when_referenced(self, tmp_path, referenced):
+        """Test that footnotes are extracted only when the body references one."""
+        import zipfile
+
+        w_ns = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        footnotes = (
+            f"<w:footnotes {w_ns}>"
+            '<w:footnote w:type="separator" w:id="-1"><w:p><w:r><w:separator/></w:r></w:p></w:footnote>'
+            '<w:footnote w:id="1"><w:p><w:r><w:t>A real note</w:t></w:r></w:p></w:footnote>'
+            "</w:footnotes>"
+        )
+        file_path = tmp_path / "notes.docx"
+        with zipfile.ZipFile(TEST_FILES_DIR / "text_file_complex.docx") as zin:
+            with zipfile.ZipFile(file_path, "w") as zout:
+                for info in zin.infolist():
+                    data = zin.read(info.filename)
+                    if info.filename == "word/document.xml" and referenced:
+                        data = data.replace(
+                            b"</w:p>",
+                            b'<w:r><w:footnoteReference w:id="1"/></w:r></w:p>',
+                            1,
+                        )
+                    zout.writestr(info, data)
+                zout.writestr("word/footnotes.xml", footnotes)
+
+        text = DOCXHandler().extract(file_path)
+        assert "Jane Doe" in text
+        assert ("[Footnote: A real note]" in text) is referenced
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Title of   the\tdoc", "Title of the doc"),
+            ("more text , here", "more text, here"),
+            ("Contents ..... 4", "Contents   4"),
+            ("a .. , b", "a, b"),
+            ("trailing ...", "trailing"),
+        ],
+    )
+    def test_docx_clean_text(self, raw, expected):
+        """Test DOCX text cleaning of whitespace, dot runs and punctuation."""
+        assert DOCXHandler()._clean_text(raw) == expected
+
+    def test_docx_dedup_bloom_filter(self):
+        """Test the Bloom filter used for DOCX text deduplication."""
+        from textxtract.handlers.docx import _Bloom
+
+        seen = _Bloom()
+        assert "cell 00" not in seen
+        assert seen.add("cell 00") is True
+        assert "cell 00" in seen
+        assert seen.add("cell 00") is False
+        assert "cell 01" not in seen
+
+    def test_docx_result_cache(self, tmp_path):
+        """Test that the opt-in DOCX result cache is used only when enabled."""
+        handler = DOCXHandler()
+        file_path = tmp_path / "cached.docx"
+        file_path.write_bytes((TEST_FILES_DIR / "text_file.docx").read_bytes())
+
+        # Off by default: nothing is cached
+        first = handler.extract(file_path)
+        assert handler._result_cache().cache_info().currsize == 0
+
+        assert handler.extract(file_path, {"cache": True}) == first
+        assert handler.extract(file_path, {"cache": True}) == first
+        assert handler._result_cache().cache_info().hits == 1
+
+        # Rewriting the file changes its size and mtime, so it is re-extracted
+        file_path.write_bytes((TEST_FILES_DIR / "text_file_complex.docx").read_bytes())
+        updated = handler.extract(file_path, {"cache": True})
+        assert updated != first
+        assert updated == handler.extract(file_path)
+        assert "Jane Doe" in updated
+
+        handler.cache_clear()
+        assert handler._result_cache().cache_info().currsize == 0
+
+    def test_docx_result_cache_relative_paths(self, tmp_path, monkeypatch):
+        """Test that same-named files in different directories do not share
+        cache entries when given as relative paths."""
+        import os
+        import zipfile
+
+        def write_variant(path, name):
+            # Stored (uncompressed) members keep both files the same size
+            with zipfile.ZipFile(TEST_FILES_DIR / "text_file_complex.docx") as zin:
+                with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zout:
+                    for info in zin.infolist():
+                        data = zin.read(info.filename)
+                        if info.filename == "word/document.xml":
+                            data = data.replace(b"Jane Doe", name)
+                        info.compress_type = zipfile.ZIP_STORED
+                        zout.writestr(info, data)
+            os.utime(path, ns=(0, 0))
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        write_variant(tmp_path / "a" / "doc.docx", b"John Doe")
+        write_variant(tmp_path / "b" / "doc.docx", b"Mary Roe")
+
+        handler = DOCXHandler()
+        monkeypatch.chdir(tmp_path / "a")
+        assert "John Doe" in handler.extract(Path("doc.docx"), {"cache": True})
+        monkeypatch.chdir(tmp_path / "b")
+        assert "Mary Roe" in handler.extract(Path("doc.docx"), {"cache": True})
+
+    def test_docx_result_cache_subclass(self, tmp_path):
+        """Test that cached extraction runs on the calling handler instance."""
+
+        class SuffixDOCXHandler(DOCXHandler):
+            def __init__(self, suffix):
+                self.suffix = suffix
+
+            def _clean_text(self, text):
+                return super()._clean_text(text) + self.suffix
+
+        file_path = tmp_path / "cached.docx"
+        file_path.write_bytes((TEST_FILES_DIR / "text_file.docx").read_bytes())
+
+        plain = DOCXHandler().extract(file_path, {"cache": True})
+        handler = SuffixDOCXHandler("!")
+        suffixed = handler.extract(file_path, {"cache": True})
+        assert suffixed == handler.extract(file_path)
+        assert suffixed != plain
+        assert SuffixDOCXHandler("?").extract(file_path, {"cache": True}) != suffixed
+
+    def test_docx_bytes_extraction_not_cached(self):
+        """Test that repeated bytes extractions do not accumulate cache entries."""
+        from textxtract.core.registry import registry
+
+        extractor = SyncTextExtractor()
+        content = (TEST_FILES_DIR / "text_file.docx").read_bytes()
+        handler = registry.get_handler(".docx")
+        handler.cache_clear()
+
+        for _ in range(3):
+            extractor.extract(content, "text_file.docx")
+        assert handler._result_cache().cache_info().currsize == 0
+
+    @pytest.mark.asyncio
+    async def test_docx_extract_async(self):
+        """Test that async DOCX extraction runs on the dedicated DOCX pool."""
+        import threading
+
+        thread_names = []
+
+        class RecordingDOCXHandler(DOCXHandler):
+            def _extract_text(self, file_path):
+                thread_names.append(threading.current_thread().name)
+                return super()._extract_text(file_path)
+
+        handler = RecordingDOCXHandler()
+        file_path = TEST_FILES_DIR / "text_file.docx"
+
+        result = await handler.extract_async(file_path)
+        assert result == handler.extract(file_path)
+        assert thread_names[0].startswith("docx-extract")
+
+    def test_corrupted_docx(self):
+        """Test extraction from corrupted DOCX."""
+        extractor = SyncTextExtractor()
+
+        with pytest.raises(ExtractionError):
+            extractor.extract(b"PK\x03\x04corrupted content", "corrupted.docx")
+
     @pytest.mark.asyncio
     async def test_async_extractor_closed(self):
         """Test that closed async extractor raises error."""
@@ -9,12 +9,186 @@ This handler extracts text from:
 """
 
 from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+import functools
+import hashlib
+import os
+import posixpath
 import re
+import zipfile
 
 from textxtract.core.base import FileTypeHandler
 from textxtract.core.exceptions import ExtractionError
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    from docx import Document as _Document
+    from docx.oxml.ns import qn as _qn
+except ImportError:
+    _Document = None
+    _qn = None
+
+# WordprocessingML tags in Clark notation, compared with == instead of
+# suffix matching on every element
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P = _W_NS + "p"
+_R = _W_NS + "r"
+_T = _W_NS + "t"
+_TAB = _W_NS + "tab"
+_PTAB = _W_NS + "ptab"
+_BR = _W_NS + "br"
+_CR = _W_NS + "cr"
+_NO_BREAK_HYPHEN = _W_NS + "noBreakHyphen"
+_TBL = _W_NS + "tbl"
+_TR = _W_NS + "tr"
+_TC = _W_NS + "tc"
+_TXBX = _W_NS + "txbxContent"
+_FOOTNOTE_REF = _W_NS + "footnoteReference"
+_ENDNOTE_REF = _W_NS + "endnoteReference"
+_NOTE_REFS = (_FOOTNOTE_REF, _ENDNOTE_REF)
+_SECT_PR = _W_NS + "sectPr"
+_HEADER_REF = _W_NS + "headerReference"
+_FOOTER_REF = _W_NS + "footerReference"
+_HF_REFS = {_HEADER_REF: "header", _FOOTER_REF: "footer"}
+_REF_TYPE = _W_NS + "type"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+# Text equivalents of run inner-content elements, as in python-docx's CT_R.text;
+# w:br only yields "\n" for line breaks (page and column breaks yield "")
+_RUN_BREAKS = {
+    _TAB: "\t",
+    _PTAB: "\t",
+    _BR: "\n",
+    _CR: "\n",
+    _NO_BREAK_HYPHEN: "-",
+}
+_STREAM_TAGS = (
+    _P, _T, _TBL, _TR, _TC, _TXBX, _SECT_PR, *_RUN_BREAKS, *_NOTE_REFS, *_HF_REFS
+)
+
+_DOCUMENT_PART = "word/document.xml"
+
+# Dedicated pool for extract_async; threads are only started on first use
+_DOCX_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="docx-extract"
+)
+
+# Patterns used by the text-cleaning path, compiled once at import time.
+# _CLEAN_RE matches a maximal gap of whitespace runs and dot runs; the
+# lookahead group is set when the gap is followed by punctuation.
+_CLEAN_RE = re.compile(r"(?:\s+|\.{2,})+(?=([.!?,:;])|)")
+_GAP_RUN_RE = re.compile(r"\s+|\.{2,}")
+_SPACE_PUNCT_RE = re.compile(r" [.!?,:;]")
+_SENT_BREAK_RE = re.compile(r"([.!?])\s*([A-Z])")
+
+
+def _clean_sub(match: "re.Match[str]") -> str:
+    """Replacement callback for ``_CLEAN_RE``.
+
+    Equivalent to collapsing whitespace, replacing dot runs with a space and
+    then dropping whitespace before punctuation, but in a single scan.
+    """
+    if match.group(1) is not None:
+        # Whitespace (and dot artifacts) before punctuation is removed
+        return ""
+    gap = match.group(0)
+    if "." not in gap:
+        return " "
+    # Each whitespace run and each dot run becomes its own space
+    return " " * len(_GAP_RUN_RE.findall(gap))
+
+
+class _PartText(NamedTuple):
+    """Text collected from a single XML part of a DOCX package.
+
+    ``tables`` holds one entry per top-level table, each a list of rows,
+    each row a list of cells, each cell a list of paragraph strings; rows of
+    nested tables follow the row that contains them. ``note_refs`` holds the
+    footnote/endnote reference tags that occur in the part, and ``sections``
+    maps ``"header"``/``"footer"`` to the relationship id of each section's
+    default header and footer, in section order.
+    """
+
+    paragraphs: List[str]
+    tables: List[List[List[List[str]]]]
+    textboxes: List[str]
+    note_refs: Set[str]
+    sections: List[Dict[str, str]]
+
+
+class _Bloom:
+    """Fixed-size Bloom filter used to deduplicate extracted text.
+
+    Membership tests never miss a string that was added; a false positive
+    drops a unique string from the output. With the default 2**20 bits and
+    three probes that rate is about 0.002% at 10,000 distinct strings and
+    0.02% at 20,000, while memory is fixed at 128 KiB regardless of
+    document size.
+    """
+
+    __slots__ = ("m", "k", "bits")
+
+    def __init__(self, m_bits: int = 1 << 20, k: int = 3):
+        self.m = m_bits
+        self.k = k
+        self.bits = bytearray(m_bits >> 3)
+
+    def _positions(self, text: str) -> List[int]:
+        # One 16-byte digest yields up to four independent 32-bit probes
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return [
+            int.from_bytes(digest[i * 4 : i * 4 + 4], "little") % self.m
+            for i in range(self.k)
+        ]
+
+    def add(self, text: str) -> bool:
+        """Add ``text`` and return True if it was not already present.
+
+        Hashes once, so callers should use this instead of a separate
+        membership test followed by ``add``.
+        """
+        new = False
+        for pos in self._positions(text):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                self.bits[pos >> 3] |= mask
+                new = True
+        return new
+
+    def __contains__(self, text: str) -> bool:
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(text)
+        )
+
+
+def _part_relationships(zf: zipfile.ZipFile, part_name: str) -> Dict[str, str]:
+    """Map relationship ids of a package part to the part names they target."""
+    base_dir, base_name = posixpath.split(part_name)
+    rels_name = posixpath.join(base_dir, "_rels", base_name + ".rels")
+    if rels_name not in zf.namelist():
+        return {}
+
+    with zf.open(rels_name) as stream:
+        root = etree.parse(stream).getroot()
+
+    targets = {}
+    for rel in root.iter(_RELATIONSHIP):
+        target = rel.get("Target")
+        if not target or rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            targets[rel.get("Id")] = target[1:]
+        else:
+            targets[rel.get("Id")] = posixpath.normpath(posixpath.join(base_dir, target))
+    return targets
+
 
 class DOCXHandler(FileTypeHandler):
     """Enhanced handler for comprehensive text extraction from DOCX files.
@@ -64,13 +238,13 @@ class DOCXHandler(FileTypeHandler):
         if not text:
             return ""
         
-        # Normalize whitespace (replace multiple spaces, tabs, newlines with single space)
-        text = re.sub(r'\s+', ' ', text)
-        # Remove excessive dots/periods (likely formatting artifacts)
-        text = re.sub(r'\.{2,}', ' ', text)
-        # Clean up spacing around punctuation (remove spaces before punctuation)
-        text = re.sub(r'\s+([.!?,:;])', r'\1', text)
-        return text.strip()
+        # Normalize whitespace (split/join collapses and strips in C)
+        text = " ".join(text.split())
+        # Remove excessive dots/periods (likely formatting artifacts) and drop
+        # spaces before punctuation, only when there is something to fix
+        if ".." in text or _SPACE_PUNCT_RE.search(text):
+            text = _CLEAN_RE.sub(_clean_sub, text).strip()
+        return text
 
     def extract(self, file_path: Path, config: Optional[dict] = None) -> str:
         """Extract text from a DOCX file with comprehensive content capture.
@@ -81,7 +255,9 @@ class DOCXHandler(FileTypeHandler):
         Args:
             file_path (Path): Path to the DOCX file to extract text from.
             config (Optional[dict], optional): Configuration options for extraction.
-                Currently not used but reserved for future enhancements.
+                Set ``"cache"`` to True to memoize the result per file (off by
+                default, since bytes inputs are extracted from a fresh temporary
+                file each time and would never hit the cache).
                 
         Returns:
             str: Extracted and cleaned text from the document with proper formatting.
@@ -96,119 +272,357 @@ class DOCXHandler(FileTypeHandler):
             - Table content is formatted with pipe separators between columns
             - Special content (footnotes, text boxes) is labeled with descriptive tags
             - Sentence breaks are automatically inserted for better readability
+            - With caching enabled, results are kept on this handler instance and
+              keyed by (resolved path, modification time, size), so repeated
+              extraction of an unchanged file does not re-parse it
         """
         try:
-            from docx import Document
-            import re
+            if (config or {}).get("cache", False):
+                stat = file_path.stat()
+                return self._result_cache()(
+                    str(file_path.resolve()), stat.st_mtime_ns, stat.st_size
+                )
+            return self._extract_text(file_path)
+        except Exception as e:
+            raise ExtractionError(f"DOCX extraction failed: {e}")
 
-            # Load the document
-            doc = Document(file_path)
-            text_parts = []
-            processed_text = set()  # Track processed text to avoid duplicates
-            
-            # Extract text from main document paragraphs
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text and text not in processed_text:
-                    text_parts.append(text)
-                    processed_text.add(text)
-            
-            # Extract text from all tables in the document
-            for table in doc.tables:
-                table_texts = []
-                for row in table.rows:
+    def cache_clear(self) -> None:
+        """Discard the DOCX extraction results cached by this handler."""
+        self._result_cache().cache_clear()
+
+    def _result_cache(self):
+        """Return this handler's memoized extractor, creating it on first use.
+
+        The cache is owned by the instance rather than the class, so
+        subclasses with their own constructor arguments or per-instance state
+        are cached through ``self`` and never rebuilt.
+        """
+        try:
+            return self._cached_extract
+        except AttributeError:
+            self._cached_extract = functools.lru_cache(maxsize=128)(
+                self._extract_keyed
+            )
+            return self._cached_extract
+
+    def _extract_keyed(self, path_str: str, mtime_ns: int, size: int) -> str:
+        # mtime_ns and size are only part of the cache key, so a file that
+        # changes on disk misses the cache and is extracted again
+        return self._extract_text(Path(path_str))
+
+    def _extract_text(self, file_path: Path) -> str:
+        """Extract and format text from a DOCX file without caching.
+
+        Args:
+            file_path (Path): Path to the DOCX file.
+
+        Returns:
+            str: Extracted and cleaned text.
+        """
+        # Parts are cleaned as they are collected, so the output is
+        # materialized only once here
+        if etree is not None and zipfile.is_zipfile(file_path):
+            result = "\n".join(self._collect_with_lxml(file_path))
+        else:
+            result = "\n".join(self._collect_with_python_docx(file_path))
+
+        # Add proper sentence breaks for improved readability; substring
+        # checks are much cheaper than a regex scan that cannot match
+        if "." in result or "!" in result or "?" in result:
+            result = _SENT_BREAK_RE.sub(r"\1\n\2", result)
+        return result.strip()
+
+    def _collect_with_lxml(self, file_path: Path) -> List[str]:
+        """Collect deduplicated text parts by streaming the package XML.
+
+        Reads the document part, the default header and footer of each
+        section, and any referenced footnote and endnote parts straight from
+        the zip container and walks each one once with
+        ``lxml.etree.iterparse``, avoiding python-docx wrapper objects.
+
+        Args:
+            file_path (Path): Path to the DOCX file.
+
+        Returns:
+            List[str]: Cleaned text lines in output order.
+        """
+        clean = self._clean_text
+        with zipfile.ZipFile(file_path) as zf:
+            names = zf.namelist()
+            if _DOCUMENT_PART not in names:
+                # Non-standard package layout; let python-docx resolve the parts
+                return self._collect_with_python_docx(file_path)
+
+            body = self._parse_part(zf, _DOCUMENT_PART)
+
+            # Resolve each section's default header and footer, in section
+            # order; a section without its own definition inherits the
+            # previous section's, as in python-docx
+            rels = _part_relationships(zf, _DOCUMENT_PART)
+            current = {"header": None, "footer": None}
+            header_footer_names: List[str] = []
+            for section in body.sections:
+                for kind in ("header", "footer"):
+                    target = rels.get(section.get(kind, ""))
+                    if target in names:
+                        current[kind] = target
+                    if current[kind] and current[kind] not in header_footer_names:
+                        header_footer_names.append(current[kind])
+            headers_footers = [self._parse_part(zf, n) for n in header_footer_names]
+
+            # Word writes footnotes.xml/endnotes.xml (with separator notes) even
+            # when no note is used; only parse them if the body references one
+            notes: List[Tuple[str, _PartText]] = []
+            if "word/footnotes.xml" in names and _FOOTNOTE_REF in body.note_refs:
+                notes.append(("Footnote", self._parse_part(zf, "word/footnotes.xml")))
+            if "word/endnotes.xml" in names and _ENDNOTE_REF in body.note_refs:
+                notes.append(("Endnote", self._parse_part(zf, "word/endnotes.xml")))
+
+        # Track processed text to avoid duplicates in bounded memory
+        processed_text = _Bloom()
+
+        def is_new(text: str) -> bool:
+            return bool(text) and processed_text.add(text)
+
+        def table_rows(tables: List[List[List[List[str]]]]) -> List[str]:
+            rows = []
+            for table in tables:
+                for row in table:
                     row_text = []
-                    for cell in row.cells:
-                        # Process each paragraph within the cell
-                        cell_paragraphs = []
-                        for paragraph in cell.paragraphs:
-                            text = paragraph.text.strip()
-                            if text and text not in processed_text:
-                                cell_paragraphs.append(text)
-                                processed_text.add(text)
+                    for cell in row:
+                        cell_paragraphs = [text for text in cell if is_new(text)]
                         if cell_paragraphs:
                             row_text.append(" ".join(cell_paragraphs))
                     if row_text:
                         # Join cell contents with pipe separator for table structure
-                        table_texts.append(" | ".join(row_text))
-                
-                # Add table content to main text collection
-                if table_texts:
-                    text_parts.extend(table_texts)
-            
-            # Extract text from headers and footers across all document sections
-            for section in doc.sections:
-                # Process header content
-                if section.header:
-                    for paragraph in section.header.paragraphs:
-                        text = paragraph.text.strip()
-                        if text and text not in processed_text:
-                            text_parts.append(text)
-                            processed_text.add(text)
-                
-                # Process footer content
-                if section.footer:
-                    for paragraph in section.footer.paragraphs:
-                        text = paragraph.text.strip()
-                        if text and text not in processed_text:
-                            text_parts.append(text)
-                            processed_text.add(text)
-            
-            # Attempt to extract footnotes and endnotes (may not be available in all documents)
-            try:
-                # Extract footnotes if present
-                if hasattr(doc, 'footnotes'):
-                    for footnote in doc.footnotes:
-                        for paragraph in footnote.paragraphs:
-                            text = paragraph.text.strip()
-                            if text and text not in processed_text:
-                                text_parts.append(f"[Footnote: {text}]")
-                                processed_text.add(text)
-                
-                # Extract endnotes if present
-                if hasattr(doc, 'endnotes'):
-                    for endnote in doc.endnotes:
-                        for paragraph in endnote.paragraphs:
-                            text = paragraph.text.strip()
-                            if text and text not in processed_text:
-                                text_parts.append(f"[Endnote: {text}]")
-                                processed_text.add(text)
-            except Exception:
-                # Footnote/endnote extraction is optional - continue if it fails
-                pass
-            
-            # Attempt to extract text from embedded text boxes and shapes using XML parsing
-            try:
-                from docx.oxml.ns import qn
-                
-                # Iterate through document XML elements to find drawing content
-                for element in doc.element.body.iter():
-                    if element.tag.endswith('}txbxContent'):
-                        # Extract text from text box elements
-                        for para in element.iter():
-                            if para.tag.endswith('}t') and para.text:
-                                text = para.text.strip()
-                                if text and text not in processed_text:
-                                    text_parts.append(f"[TextBox: {text}]")
-                                    processed_text.add(text)
-            except Exception:
-                # Text box extraction is optional - continue if it fails
-                pass
+                        rows.append(clean(" | ".join(row_text)))
+            return rows
+
+        text_parts = [clean(text) for text in body.paragraphs if is_new(text)]
+        text_parts.extend(table_rows(body.tables))
+
+        for part in headers_footers:
+            text_parts.extend(clean(text) for text in part.paragraphs if is_new(text))
+            text_parts.extend(table_rows(part.tables))
+
+        for label, part in notes:
+            text_parts.extend(
+                clean(f"[{label}: {text}]") for text in part.paragraphs if is_new(text)
+            )
+
+        for part in [body, *headers_footers]:
+            text_parts.extend(
+                clean(f"[TextBox: {text}]") for text in part.textboxes if is_new(text)
+            )
+
+        return text_parts
+
+    def _parse_part(self, zf: zipfile.ZipFile, name: str) -> _PartText:
+        """Stream a single XML part and collect its text in one pass.
+
+        Paragraph, cell, row and table boundaries are tracked with small
+        stacks so nesting is preserved without materializing a DOM; each
+        paragraph and table element is cleared once its text is consumed.
+
+        Args:
+            zf (zipfile.ZipFile): Open DOCX package.
+            name (str): Part name inside the package, e.g. ``word/document.xml``.
+
+        Returns:
+            _PartText: Paragraphs, tables and text-box strings found in the part.
+        """
+        part = _PartText([], [], [], set(), [])
+        para_stack: List[List[str]] = []
+        cell_stack: List[List[str]] = []
+        row_stack: List[List[List[str]]] = []
+        # Rows of tables nested inside the currently open rows
+        nested_rows_stack: List[List[List[List[str]]]] = []
+        table_stack: List[List[List[List[str]]]] = []
+        # w:sectPrChange holds a nested w:sectPr, so sections are a stack too
+        section_stack: List[Dict[str, str]] = []
+        txbx_depth = 0
+
+        with zf.open(name) as stream:
+            for event, elem in etree.iterparse(
+                stream,
+                events=("start", "end"),
+                tag=_STREAM_TAGS,
+                resolve_entities=False,
+            ):
+                tag = elem.tag
+                if event == "start":
+                    if tag == _P:
+                        para_stack.append([])
+                    elif tag == _TC:
+                        cell_stack.append([])
+                    elif tag == _TR:
+                        row_stack.append([])
+                        nested_rows_stack.append([])
+                    elif tag == _TBL:
+                        table_stack.append([])
+                    elif tag == _TXBX:
+                        txbx_depth += 1
+                    elif tag == _SECT_PR:
+                        section_stack.append({})
+                    continue
+
+                if tag == _T:
+                    if elem.text:
+                        if txbx_depth:
+                            # Text boxes are reported per text run, as tagged entries
+                            part.textboxes.append(elem.text.strip())
+                        elif para_stack:
+                            para_stack[-1].append(elem.text)
+                elif tag in _RUN_BREAKS:
+                    # w:tab also appears in paragraph tab-stop definitions
+                    if para_stack and not txbx_depth and elem.getparent().tag == _R:
+                        if tag == _BR and elem.get(_REF_TYPE, "textWrapping") != "textWrapping":
+                            continue
+                        para_stack[-1].append(_RUN_BREAKS[tag])
+                elif tag == _P:
+                    text = "".join(para_stack.pop()).strip()
+                    if text and not txbx_depth:
+                        (cell_stack[-1] if cell_stack else part.paragraphs).append(text)
+                    elem.clear()
+                elif tag == _TC:
+                    cell = cell_stack.pop()
+                    if row_stack:
+                        row_stack[-1].append(cell)
+                elif tag == _TR:
+                    row = row_stack.pop()
+                    nested_rows = nested_rows_stack.pop()
+                    if table_stack:
+                        table_stack[-1].append(row)
+                        table_stack[-1].extend(nested_rows)
+                elif tag == _TBL:
+                    rows = table_stack.pop()
+                    if nested_rows_stack:
+                        nested_rows_stack[-1].extend(rows)
+                    else:
+                        part.tables.append(rows)
+                    elem.clear()
+                elif tag == _TXBX:
+                    txbx_depth -= 1
+                elif tag in _NOTE_REFS:
+                    part.note_refs.add(tag)
+                elif tag in _HF_REFS:
+                    if section_stack and elem.get(_REF_TYPE) == "default":
+                        section_stack[-1][_HF_REFS[tag]] = elem.get(_R_ID)
+                elif tag == _SECT_PR:
+                    section = section_stack.pop()
+                    if not section_stack:
+                        part.sections.append(section)
+
+        return part
+
+    def _collect_with_python_docx(self, file_path: Path) -> List[str]:
+        """Collect deduplicated text parts by walking python-docx objects.
+
+        Used when lxml is unavailable or the package does not follow the
+        standard ``word/document.xml`` layout.
+
+        Args:
+            file_path (Path): Path to the DOCX file.
+
+        Returns:
+            List[str]: Cleaned text lines in output order.
+        """
+        if _Document is None:
+            raise ExtractionError(
+                "python-docx package is not installed. Install with 'pip install textxtract[docx]'"
+            )
+
+        clean = self._clean_text
+
+        # Load the document
+        doc = _Document(file_path)
+        text_parts = []
+        # Track processed text to avoid duplicates in bounded memory
+        processed_text = _Bloom()
+        
+        # Extract text from main document paragraphs
+        for paragraph in doc.paragraphs:
+            text = paragraph.text.strip()
+            if text and processed_text.add(text):
+                text_parts.append(clean(text))
+        
+        # Extract text from all tables in the document
+        for table in doc.tables:
+            table_texts = []
+            # Walk the underlying w:tr/w:tc nodes directly: row.cells repeats
+            # merged cells once per grid column and re-wraps every paragraph
+            for tr in table._tbl.iter(_qn("w:tr")):
+                row_text = []
+                for tc in tr.iterchildren(_qn("w:tc")):
+                    # Process each paragraph within the cell
+                    cell_paragraphs = []
+                    for p in tc.iterchildren(_qn("w:p")):
+                        # CT_P.text matches Paragraph.text without building a wrapper
+                        text = p.text.strip()
+                        if text and processed_text.add(text):
+                            cell_paragraphs.append(text)
+                    if cell_paragraphs:
+                        row_text.append(" ".join(cell_paragraphs))
+                if row_text:
+                    # Join cell contents with pipe separator for table structure
+                    table_texts.append(clean(" | ".join(row_text)))
             
-            # Process and format the final output
-            if text_parts:
-                # Clean each text part and filter out empty content
-                cleaned_parts = [self._clean_text(part) for part in text_parts if part.strip()]
-                result = "\n".join(cleaned_parts)
-                
-                # Add proper sentence breaks for improved readability
-                result = re.sub(r'([.!?])\s*([A-Z])', r'\1\n\2', result)
-                return result.strip()
+            # Add table content to main text collection
+            if table_texts:
+                text_parts.extend(table_texts)
+        
+        # Extract text from headers and footers across all document sections
+        for section in doc.sections:
+            # Process header content
+            if section.header:
+                for paragraph in section.header.paragraphs:
+                    text = paragraph.text.strip()
+                    if text and processed_text.add(text):
+                        text_parts.append(clean(text))
             
-            return ""
+            # Process footer content
+            if section.footer:
+                for paragraph in section.footer.paragraphs:
+                    text = paragraph.text.strip()
+                    if text and processed_text.add(text):
+                        text_parts.append(clean(text))
+        
+        # Attempt to extract footnotes and endnotes (may not be available in all documents)
+        try:
+            # Extract footnotes if present
+            if hasattr(doc, 'footnotes'):
+                for footnote in doc.footnotes:
+                    for paragraph in footnote.paragraphs:
+                        text = paragraph.text.strip()
+                        if text and processed_text.add(text):
+                            text_parts.append(clean(f"[Footnote: {text}]"))
             
-        except Exception as e:
-            raise ExtractionError(f"DOCX extraction failed: {e}")
+            # Extract endnotes if present
+            if hasattr(doc, 'endnotes'):
+                for endnote in doc.endnotes:
+                    for paragraph in endnote.paragraphs:
+                        text = paragraph.text.strip()
+                        if text and processed_text.add(text):
+                            text_parts.append(clean(f"[Endnote: {text}]"))
+        except Exception:
+            # Footnote/endnote extraction is optional - continue if it fails
+            pass
+        
+        # Attempt to extract text from embedded text boxes and shapes using XML parsing
+        try:
+            # Let lxml filter by tag in C so only text-box content reaches Python
+            for txbx in doc.element.body.iter(_TXBX):
+                # Extract text from text box elements
+                for t in txbx.iter(_T):
+                    if t.text:
+                        text = t.text.strip()
+                        if text and processed_text.add(text):
+                            text_parts.append(clean(f"[TextBox: {text}]"))
+        except Exception:
+            # Text box extraction is optional - continue if it fails
+            pass
+
+        return text_parts
 
     async def extract_async(
         self, file_path: Path, config: Optional[dict] = None
@@ -221,7 +635,7 @@ class DOCXHandler(FileTypeHandler):
         Args:
             file_path (Path): Path to the DOCX file to extract text from.
             config (Optional[dict], optional): Configuration options for extraction.
-                Currently not used but reserved for future enhancements.
+                Same options as :meth:`extract`.
                 
         Returns:
             str: Extracted and cleaned text from the document with proper formatting.
@@ -232,9 +646,13 @@ class DOCXHandler(FileTypeHandler):
                 python-docx library is not available.
                 
         Note:
-            This method uses asyncio.to_thread() to run the synchronous extraction
-            in a thread pool, making it suitable for async/await usage patterns.
+            This method runs the synchronous extraction on a dedicated, bounded
+            thread pool shared by all DOCX extractions, so concurrent DOCX work
+            does not compete with other tasks for the event loop's default
+            executor.
         """
         import asyncio
 
-        return await asyncio.to_thread(self.extract, file_path, config)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_DOCX_POOL, self.extract, file_path, config)
+